@@ -4,32 +4,78 @@ Admin configuration for the academies app.
 This module registers all academy-related models with the Django admin site
 and configures their admin interfaces with appropriate display fields, filters,
 and search capabilities.
+
+Profile admins only match users by exact email (served by the unique index);
+free-text user search belongs to the User admin.
 """
 
 from django.contrib import admin
 
-from apps.core.admin import AcademyScopedAdmin, BaseModelAdmin, ImagePreviewMixin
+from apps.core.admin import (
+    AcademyScopedAdmin,
+    BaseModelAdmin,
+    ImagePreviewMixin,
+    SearchVectorAdminMixin,
+)
 
 from .models import (
+    ACADEMY_SEARCH_FIELDS,
     Academy,
     AcademyAdminProfile,
     CoachProfile,
     ExternalClientProfile,
+    ParentChild,
     ParentProfile,
     PlayerProfile,
 )
 
 
+class ExperienceYearsListFilter(admin.SimpleListFilter):
+    """
+    Filter coaches by experience bracket.
+    Uses fixed ranges instead of listing every distinct experience value.
+    """
+
+    title = "experience"
+    parameter_name = "experience"
+    ranges = {
+        "0-2": (0, 2),
+        "3-5": (3, 5),
+        "6-10": (6, 10),
+        "11+": (11, None),
+    }
+
+    def lookups(self, request, model_admin):
+        """Return the available experience brackets."""
+        return [(key, f"{key} years") for key in self.ranges]
+
+    def queryset(self, request, queryset):
+        """Filter the queryset to the selected experience bracket."""
+        if self.value() not in self.ranges:
+            return queryset
+        low, high = self.ranges[self.value()]
+        queryset = queryset.filter(experience_years__gte=low)
+        if high is not None:
+            queryset = queryset.filter(experience_years__lte=high)
+        return queryset
+
+
 @admin.register(Academy)
-class AcademyAdmin(ImagePreviewMixin, BaseModelAdmin):
+class AcademyAdmin(SearchVectorAdminMixin, ImagePreviewMixin, BaseModelAdmin):
     """
     Admin configuration for Academy model.
     Includes image preview for logo and custom display fields.
+    Search is answered from the academy full-text index; emails and phone
+    numbers also match on any part of the value.
     """
 
     list_display = ["id", "name", "email", "phone", "image_preview", "is_active"]
     list_filter = ["is_active", "created_at", "established_date"]
     search_fields = ["name", "name_ar", "email", "phone"]
+    search_vector_fields = ACADEMY_SEARCH_FIELDS
+    search_contains_fields = ("email", "phone")
+    # "name" must stay listed: __str__ reads it for admin log entries
+    list_only_fields = ("name", "email", "phone", "logo", "is_active", "created_at")
     fieldsets = (
         (
             "Basic Information",
@@ -40,13 +86,9 @@ class AcademyAdmin(ImagePreviewMixin, BaseModelAdmin):
     )
     readonly_fields = ("created_at", "updated_at")
 
-    def image_preview(self, obj):
-        """Preview academy logo in admin list view."""
-        if obj.logo:
-            return super().image_preview(obj)
-        return "No Logo"
-
-    image_preview.short_description = "Logo"
+    image_field = "logo"
+    no_image_text = "No Logo"
+    image_preview_label = "Logo"
 
 
 @admin.register(AcademyAdminProfile)
@@ -54,9 +96,23 @@ class AcademyAdminProfileAdmin(AcademyScopedAdmin):
     """Admin configuration for AcademyAdminProfile model."""
 
     list_display = ["id", "user", "academy", "position", "is_active"]
-    list_filter = ["is_active", "academy", "position"]
-    search_fields = ["user__email", "user__first_name", "user__last_name", "position"]
+    list_filter = [
+        "is_active",
+        ("academy", admin.RelatedOnlyFieldListFilter),
+        "position",
+    ]
+    search_fields = ["user__email__exact", "position"]
     raw_id_fields = ["user", "academy"]
+    list_select_related = ("user", "academy")
+    list_only_fields = (
+        "polymorphic_ctype",
+        "user__email",
+        "user__user_type",
+        "academy__name",
+        "position",
+        "is_active",
+        "created_at",
+    )
 
 
 @admin.register(CoachProfile)
@@ -71,14 +127,25 @@ class CoachProfileAdmin(AcademyScopedAdmin):
         "experience_years",
         "is_active",
     ]
-    list_filter = ["is_active", "academy", "specialization", "experience_years"]
-    search_fields = [
-        "user__email",
-        "user__first_name",
-        "user__last_name",
+    list_filter = [
+        "is_active",
+        ("academy", admin.RelatedOnlyFieldListFilter),
         "specialization",
+        ExperienceYearsListFilter,
     ]
+    search_fields = ["user__email__exact", "specialization"]
     raw_id_fields = ["user", "academy"]
+    list_select_related = ("user", "academy")
+    list_only_fields = (
+        "polymorphic_ctype",
+        "user__email",
+        "user__user_type",
+        "academy__name",
+        "specialization",
+        "experience_years",
+        "is_active",
+        "created_at",
+    )
 
 
 @admin.register(PlayerProfile)
@@ -94,14 +161,91 @@ class PlayerProfileAdmin(AcademyScopedAdmin):
         "dominant_foot",
         "is_active",
     ]
-    list_filter = ["is_active", "academy", "position", "dominant_foot"]
-    search_fields = [
-        "user__email",
-        "user__first_name",
-        "user__last_name",
-        "jersey_number",
+    list_filter = [
+        "is_active",
+        ("academy", admin.RelatedOnlyFieldListFilter),
+        "position",
+        "dominant_foot",
     ]
+    search_fields = ["user__email__exact", "position"]
     raw_id_fields = ["user", "academy"]
+    list_select_related = ("user", "academy")
+    list_only_fields = (
+        "polymorphic_ctype",
+        "user__email",
+        "user__user_type",
+        "academy__name",
+        "jersey_number",
+        "position",
+        "dominant_foot",
+        "is_active",
+        "created_at",
+    )
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Also match a numeric search term as an exact jersey number.
+
+        Kept out of search_fields, which would compare the number as text
+        and bypass the jersey number index.
+        """
+        results, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        try:
+            jersey_number = int(search_term.strip())
+        except ValueError:
+            # Not a number, e.g. text or digit-like characters such as "²"
+            jersey_number = None
+        if jersey_number is not None:
+            results |= queryset.filter(jersey_number=jersey_number)
+        return results, may_have_duplicates
+
+
+class ParentChildInline(admin.TabularInline):
+    """
+    Inline for the existing parent/child links of a ParentProfile.
+
+    The child is shown read-only from a joined row: a raw id widget would
+    look each linked child up separately. New links go through
+    ParentChildAddInline.
+    """
+
+    model = ParentChild
+    fields = ["child_name", "is_primary"]
+    readonly_fields = ["child_name"]
+    extra = 0
+
+    def get_queryset(self, request):
+        """Join the users used by the child label and the link's __str__."""
+        return (
+            super().get_queryset(request).select_related("parent__user", "child__user")
+        )
+
+    def has_add_permission(self, request, obj=None):
+        """Links are added through ParentChildAddInline."""
+        return False
+
+    def child_name(self, obj):
+        """Display the linked child."""
+        return str(obj.child)
+
+    child_name.short_description = "Child"
+
+
+class ParentChildAddInline(admin.TabularInline):
+    """Inline for adding new children to a ParentProfile."""
+
+    model = ParentChild
+    fields = ["child", "is_primary"]
+    raw_id_fields = ["child"]
+    extra = 0
+    verbose_name = "new child link"
+    verbose_name_plural = "add children"
+
+    def get_queryset(self, request):
+        """Only render blank forms; existing links use ParentChildInline."""
+        return super().get_queryset(request).none()
 
 
 @admin.register(ParentProfile)
@@ -110,9 +254,18 @@ class ParentProfileAdmin(BaseModelAdmin):
 
     list_display = ["id", "user", "relationship", "is_active"]
     list_filter = ["is_active", "relationship"]
-    search_fields = ["user__email", "user__first_name", "user__last_name"]
+    search_fields = ["user__email__exact"]
     raw_id_fields = ["user"]
-    filter_horizontal = ["children"]
+    inlines = [ParentChildInline, ParentChildAddInline]
+    list_select_related = ("user",)
+    list_only_fields = (
+        "polymorphic_ctype",
+        "user__email",
+        "user__user_type",
+        "relationship",
+        "is_active",
+        "created_at",
+    )
 
 
 @admin.register(ExternalClientProfile)
@@ -121,10 +274,14 @@ class ExternalClientProfileAdmin(BaseModelAdmin):
 
     list_display = ["id", "user", "organization", "is_active"]
     list_filter = ["is_active"]
-    search_fields = [
+    search_fields = ["user__email__exact", "organization"]
+    raw_id_fields = ["user"]
+    list_select_related = ("user",)
+    list_only_fields = (
+        "polymorphic_ctype",
         "user__email",
-        "user__first_name",
-        "user__last_name",
+        "user__user_type",
         "organization",
-    ]
-    raw_id_fields = ["user"]
+        "is_active",
+        "created_at",
+    )
@@ -5,3 +5,10 @@ class AcademiesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.academies"
     verbose_name = "Academies"
+
+    def ready(self):
+        """
+        Import signals when the app is ready.
+        This ensures that signals are connected when Django starts.
+        """
+        import apps.academies.signals
@@ -0,0 +1,35 @@
+"""Management command to rebuild the academy active-count columns.
+
+The counters are maintained by signals; run this after bulk updates that
+bypass them, or to repair drift.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.academies.models import Academy
+
+
+class Command(BaseCommand):
+    help = "Recompute the active coach/player/team/field counts of academies"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--academy",
+            type=int,
+            action="append",
+            dest="academy_ids",
+            help="Only recompute this academy ID (can be given more than once)",
+        )
+
+    def handle(self, *args, **options):
+        academies = Academy.objects.all()
+        if options["academy_ids"]:
+            academies = academies.filter(pk__in=options["academy_ids"])
+
+        updated = academies.refresh_active_counts()
+        for academy_id in academies.values_list("pk", flat=True):
+            Academy.invalidate_statistics(academy_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed counters for {updated} academies")
+        )
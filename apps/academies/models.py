@@ -1,6 +1,91 @@
+from functools import cached_property
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, NullIf
+
+from apps.core.models import BaseModel, TimestampedModel, UserProfile
+
+# Columns covered by the academy full-text search index (see AcademyAdmin)
+ACADEMY_SEARCH_FIELDS = ("name", "name_ar", "email", "phone")
+
+# Related manager -> Academy column holding its number of active rows
+ACTIVE_COUNT_FIELDS = {
+    "coaches": "active_coach_count",
+    "players": "active_player_count",
+    "teams": "active_team_count",
+    "fields": "active_field_count",
+}
+
+
+class AcademyQuerySet(models.QuerySet):
+    """
+    QuerySet for Academy with helpers for database-side statistics.
+    """
 
-from apps.core.models import BaseModel, UserProfile
+    def _active_count(self, relation):
+        """Return a correlated subquery counting the active rows of a relation."""
+        remote_field = self.model._meta.get_field(relation).field
+        counts = (
+            remote_field.model._base_manager.filter(
+                **{remote_field.name: OuterRef("pk"), "is_active": True}
+            )
+            .order_by()
+            .values(remote_field.name)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    def with_active_counts(self, *relations):
+        """
+        Annotate ``total_<relation>`` with the number of active related rows.
+
+        Each count is a correlated subquery, so all totals come back in the
+        same SELECT without joining the related tables into one another.
+        """
+        relations = relations or ACTIVE_COUNT_FIELDS
+        return self.annotate(
+            **{
+                f"total_{relation}": self._active_count(relation)
+                for relation in relations
+            }
+        )
+
+    def with_parent_count(self):
+        """
+        Annotate ``total_parents`` with the number of distinct active parents
+        of the academy's active players.
+        """
+        parents = (
+            ParentProfile.objects.filter(
+                is_active=True,
+                children__academy=OuterRef("pk"),
+                children__is_active=True,
+            )
+            .order_by()
+            .values("children__academy")
+            .annotate(total=Count("pk", distinct=True))
+            .values("total")
+        )
+        return self.annotate(total_parents=Coalesce(Subquery(parents), 0))
+
+    def refresh_active_counts(self, *relations):
+        """
+        Rewrite the ``active_*_count`` columns from the related rows.
+
+        Runs as a single UPDATE; returns the number of academies updated.
+        """
+        relations = relations or ACTIVE_COUNT_FIELDS
+        return self.update(
+            **{
+                ACTIVE_COUNT_FIELDS[relation]: self._active_count(relation)
+                for relation in relations
+            }
+        )
 
 
 class Academy(BaseModel):
@@ -25,88 +110,166 @@ class Academy(BaseModel):
     logo = models.ImageField(upload_to="academies/logos/", blank=True, null=True)
     address = models.TextField()
     phone = models.CharField(max_length=15)
-    email = models.EmailField()
+    email = models.EmailField(db_index=True)
     website = models.URLField(blank=True)
     established_date = models.DateField(null=True, blank=True)
 
+    # Denormalized active counts, kept current by the academies signals and
+    # rebuilt by the recompute_academy_counters command
+    active_coach_count = models.PositiveIntegerField(default=0, editable=False)
+    active_player_count = models.PositiveIntegerField(default=0, editable=False)
+    active_team_count = models.PositiveIntegerField(default=0, editable=False)
+    active_field_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = AcademyQuerySet.as_manager()
+
     def __str__(self):
-        """Return string representation of the academy."""
-        return self.name
+        """
+        Return string representation of the academy.
+
+        Reads the loaded value directly, so an instance fetched with ``name``
+        deferred does not issue a SELECT just to be printed. Querysets used
+        for admin and logging output should keep ``name`` in their columns.
+        """
+        name = self.__dict__.get("name")
+        return name if name is not None else f"Academy #{self.pk}"
+
+    def save(self, *args, **kwargs):
+        """
+        Save the academy without writing the counter columns back.
+
+        The counters are rewritten by separate UPDATEs from the academies
+        signals; saving the values loaded with this instance would undo any
+        recount made since it was fetched.
+        """
+        if (
+            not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            skipped = {*ACTIVE_COUNT_FIELDS.values(), *self.get_deferred_fields()}
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in skipped
+            ]
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload the academy and drop any memoized statistics."""
+        self.__dict__.pop("statistics", None)
+        super().refresh_from_db(*args, **kwargs)
 
     @property
     def basic_statistics(self):
-        """Get basic statistics for the academy."""
+        """Get basic statistics for the academy from its counter columns."""
         return {
-            "total_coaches": self.coaches.filter(is_active=True).count(),
-            "total_players": self.players.filter(is_active=True).count(),
-            "total_teams": self.teams.filter(is_active=True).count(),
-            "total_fields": self.fields.filter(is_active=True).count(),
+            "total_coaches": self.active_coach_count,
+            "total_players": self.active_player_count,
+            "total_teams": self.active_team_count,
+            "total_fields": self.active_field_count,
         }
 
-    @property
+    # Histogram name -> (related manager, grouped column) for ``statistics``
+    STATISTICS_HISTOGRAMS = {
+        "coaches_by_specialization": ("coaches", "specialization"),
+        "players_by_position": ("players", "position"),
+        "teams_by_age_group": ("teams", "age_group"),
+        "fields_by_type": ("fields", "field_type"),
+    }
+
+    # Seconds a computed ``statistics`` payload is served from the cache
+    STATISTICS_CACHE_TIMEOUT = 300
+
+    @staticmethod
+    def statistics_cache_key(academy_id):
+        """Return the cache key holding the statistics of an academy."""
+        return f"academy:{academy_id}:statistics"
+
+    @classmethod
+    def invalidate_statistics(cls, academy_id):
+        """Drop the cached statistics of an academy."""
+        cache.delete(cls.statistics_cache_key(academy_id))
+
+    @cached_property
     def statistics(self):
-        """Get comprehensive statistics for the academy."""
-        # Get active counts
-        active_coaches = self.coaches.filter(is_active=True)
-        active_players = self.players.filter(is_active=True)
-        active_teams = (
-            self.teams.filter(is_active=True) if hasattr(self, "teams") else []
+        """
+        Get comprehensive statistics for the academy.
+
+        The result is cached for STATISTICS_CACHE_TIMEOUT seconds and dropped
+        by the academies signals whenever a coach, player, team or field of
+        the academy is created or deleted, or changes its academy, active
+        flag or grouped column.
+        """
+        return cache.get_or_set(
+            self.statistics_cache_key(self.pk),
+            self._compute_statistics,
+            self.STATISTICS_CACHE_TIMEOUT,
         )
-        active_fields = self.fields.filter(is_active=True)
-
-        # Build detailed statistics similar to AcademyDetailSerializer
-        stats = {
-            "total_coaches": active_coaches.count(),
-            "total_players": active_players.count(),
-            "total_teams": len(active_teams)
-            if hasattr(active_teams, "__len__")
-            else active_teams.count(),
-            "total_fields": active_fields.count(),
-            "coaches_by_specialization": self._get_coaches_by_specialization(
-                active_coaches
-            ),
-            "players_by_position": self._get_players_by_position(active_players),
-            "teams_by_age_group": self._get_teams_by_age_group(active_teams),
-            "fields_by_type": self._get_fields_by_type(active_fields),
+
+    def _compute_statistics(self):
+        """Compute the statistics payload from the database."""
+        histograms = {name: {} for name in self.STATISTICS_HISTOGRAMS}
+        for name, value, total in self._histogram_rows():
+            histograms[name][value] = total
+
+        # Totals are the sums of the grouped counts, no extra COUNT queries
+        return {
+            "total_coaches": sum(histograms["coaches_by_specialization"].values()),
+            "total_players": sum(histograms["players_by_position"].values()),
+            "total_teams": sum(histograms["teams_by_age_group"].values()),
+            "total_fields": sum(histograms["fields_by_type"].values()),
+            **histograms,
         }
 
-        return stats
-
-    def _get_coaches_by_specialization(self, coaches):
-        """Group coaches by specialization."""
-        specializations = {}
-        for coach in coaches:
-            spec = coach.specialization or "Not Specified"
-            specializations[spec] = specializations.get(spec, 0) + 1
-        return specializations
-
-    def _get_players_by_position(self, players):
-        """Group players by position."""
-        positions = {}
-        for player in players:
-            pos = player.position or "Not Specified"
-            positions[pos] = positions.get(pos, 0) + 1
-        return positions
-
-    def _get_teams_by_age_group(self, teams):
-        """Group teams by age group."""
-        age_groups = {}
-        for team in teams:
-            age_group = team.age_group or "Not Specified"
-            age_groups[age_group] = age_groups.get(age_group, 0) + 1
-        return age_groups
-
-    def _get_fields_by_type(self, fields):
-        """Group fields by type."""
-        field_types = {}
-        for field in fields:
-            field_type = field.field_type if field.field_type else "Not Specified"
-            field_types[field_type] = field_types.get(field_type, 0) + 1
-        return field_types
+    def _histogram_rows(self):
+        """
+        Return ``(histogram, value, count)`` rows for every histogram.
+
+        Each relation is grouped by its column and the grouped queries are
+        combined with UNION ALL, so all histograms come back in one query.
+        Empty and null values are grouped together as "Not Specified".
+        """
+        grouped = [
+            getattr(self, relation)
+            .filter(is_active=True)
+            .order_by()
+            .values(
+                histogram=Value(name, output_field=models.CharField()),
+                value=Coalesce(
+                    NullIf(F(field_name), Value("")), Value("Not Specified")
+                ),
+            )
+            .annotate(total=Count("pk"))
+            .values_list("histogram", "value", "total")
+            for name, (relation, field_name) in self.STATISTICS_HISTOGRAMS.items()
+        ]
+        return grouped[0].union(*grouped[1:], all=True)
 
     class Meta:
         verbose_name_plural = "Academies"
         db_table = "academies_academy"
+        # Trigram indexes back the admin/API "icontains" search on these columns
+        indexes = [
+            GinIndex(
+                fields=["name"], opclasses=["gin_trgm_ops"], name="academy_name_trgm"
+            ),
+            GinIndex(
+                fields=["name_ar"],
+                opclasses=["gin_trgm_ops"],
+                name="academy_name_ar_trgm",
+            ),
+            GinIndex(
+                fields=["email"], opclasses=["gin_trgm_ops"], name="academy_email_trgm"
+            ),
+            GinIndex(
+                fields=["phone"], opclasses=["gin_trgm_ops"], name="academy_phone_trgm"
+            ),
+            GinIndex(
+                SearchVector(*ACADEMY_SEARCH_FIELDS, config="simple"),
+                name="academy_search_idx",
+            ),
+        ]
 
 
 class AcademyAdminProfile(UserProfile):
@@ -128,6 +291,15 @@ class AcademyAdminProfile(UserProfile):
     )
     position = models.CharField(max_length=100, blank=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=["position"],
+                opclasses=["gin_trgm_ops"],
+                name="academyadmin_position_trgm",
+            ),
+        ]
+
 
 class CoachProfile(UserProfile):
     """
@@ -151,6 +323,18 @@ class CoachProfile(UserProfile):
     experience_years = models.PositiveIntegerField(default=0)
     certification = models.CharField(max_length=200, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["academy", "specialization"], name="coach_academy_spec_idx"
+            ),
+            GinIndex(
+                fields=["specialization"],
+                opclasses=["gin_trgm_ops"],
+                name="coach_specialization_trgm",
+            ),
+        ]
+
 
 class PlayerProfile(UserProfile):
     """
@@ -170,6 +354,12 @@ class PlayerProfile(UserProfile):
     - Academy model for the foreign key relationship
     """
 
+    DOMINANT_FOOT_CHOICES = (
+        ("left", "Left"),
+        ("right", "Right"),
+        ("both", "Both"),
+    )
+
     academy = models.ForeignKey(
         Academy, on_delete=models.CASCADE, related_name="players", null=True, blank=True
     )
@@ -178,11 +368,27 @@ class PlayerProfile(UserProfile):
     height = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     weight = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     dominant_foot = models.CharField(
-        max_length=10,
-        choices=[("left", "Left"), ("right", "Right"), ("both", "Both")],
-        blank=True,
+        max_length=10, choices=DOMINANT_FOOT_CHOICES, blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["academy", "position"], name="player_academy_pos_idx"),
+            GinIndex(
+                fields=["position"],
+                opclasses=["gin_trgm_ops"],
+                name="player_position_trgm",
+            ),
+        ]
+        constraints = [
+            # jersey_number leads so the index also serves jersey-only lookups
+            models.UniqueConstraint(
+                fields=["jersey_number", "academy"],
+                condition=models.Q(jersey_number__isnull=False),
+                name="uniq_jersey_per_academy",
+            ),
+        ]
+
 
 class ParentProfile(UserProfile):
     """
@@ -198,11 +404,49 @@ class ParentProfile(UserProfile):
     - PlayerProfile for the many-to-many relationship
     """
 
-    children = models.ManyToManyField(PlayerProfile, related_name="parents", blank=True)
-    relationship = models.CharField(
-        max_length=20,
-        choices=[("father", "Father"), ("mother", "Mother"), ("guardian", "Guardian")],
+    RELATIONSHIP_CHOICES = (
+        ("father", "Father"),
+        ("mother", "Mother"),
+        ("guardian", "Guardian"),
+    )
+
+    children = models.ManyToManyField(
+        PlayerProfile, through="ParentChild", related_name="parents", blank=True
     )
+    relationship = models.CharField(max_length=20, choices=RELATIONSHIP_CHOICES)
+
+
+class ParentChild(TimestampedModel):
+    """
+    Link between a parent and one of their children.
+
+    Replaces the implicit ParentProfile.children through table so both join
+    directions are indexed and the link can carry its own data.
+
+    Relationships:
+    - Many-to-One with ParentProfile (parent)
+    - Many-to-One with PlayerProfile (child)
+    """
+
+    parent = models.ForeignKey(
+        ParentProfile, on_delete=models.CASCADE, related_name="child_links"
+    )
+    child = models.ForeignKey(
+        PlayerProfile, on_delete=models.CASCADE, related_name="parent_links"
+    )
+    is_primary = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = ["parent", "child"]
+        indexes = [
+            models.Index(fields=["child", "parent"], name="parentchild_child_idx"),
+            models.Index(
+                fields=["parent", "is_primary"], name="parentchild_primary_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.parent} - {self.child}"
 
 
 class ExternalClientProfile(UserProfile):
@@ -220,3 +464,12 @@ class ExternalClientProfile(UserProfile):
 
     organization = models.CharField(max_length=200, blank=True)
     preferred_sports = models.CharField(max_length=200, blank=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=["organization"],
+                opclasses=["gin_trgm_ops"],
+                name="client_organization_trgm",
+            ),
+        ]
@@ -1,10 +1,18 @@
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.utils import timezone
 from rest_framework import serializers
 
-from apps.core.serializers import BaseUserSerializer
+from apps.bookings.models import Field, FieldBooking
+from apps.core.serializers import BaseUserSerializer, CachedFieldsSerializerMixin
+from apps.players.models import Team
 
 from .models import (
+    ACTIVE_COUNT_FIELDS,
     Academy,
     AcademyAdminProfile,
     CoachProfile,
@@ -16,7 +24,33 @@ from .models import (
 User = get_user_model()
 
 
-class UserCreateSerializer(serializers.ModelSerializer):
+USER_SUMMARY_FIELDS = ("id", "email", "first_name", "last_name")
+
+
+def _user_summary(user):
+    """Return the compact user representation embedded in nested payloads."""
+    return {name: getattr(user, name) for name in USER_SUMMARY_FIELDS}
+
+
+def _summary_rows(queryset, *fields):
+    """
+    Read ``fields`` plus the user summary of each row with ``values()``.
+
+    The user columns are folded into a nested "user" dict, matching
+    _user_summary(), without instantiating profiles or users.
+    """
+    user_columns = [f"user__{name}" for name in USER_SUMMARY_FIELDS]
+    rows = []
+    for row in queryset.values(*fields, *user_columns):
+        row["user"] = {
+            name: row.pop(column)
+            for name, column in zip(USER_SUMMARY_FIELDS, user_columns)
+        }
+        rows.append(row)
+    return rows
+
+
+class UserCreateSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for creating users nested within profile creation."""
 
     password = serializers.CharField(write_only=True, validators=[validate_password])
@@ -24,7 +58,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = [
+        fields = (
             "email",
             "password",
             "password_confirm",
@@ -32,7 +66,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
             "last_name",
             "user_type",
             "phone",
-        ]
+        )
         extra_kwargs = {
             "email": {"required": True},
             "first_name": {"required": True},
@@ -52,13 +86,12 @@ class UserCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop("password_confirm", None)
         password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        return User.objects.create_user(password=password, **validated_data)
 
 
-class CoachProfileNestedSerializer(serializers.ModelSerializer):
+class CoachProfileNestedSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     """
     Nested serializer for coach profiles within academy details.
     """
@@ -67,7 +100,7 @@ class CoachProfileNestedSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CoachProfile
-        fields = [
+        fields = (
             "id",
             "user",
             "specialization",
@@ -77,10 +110,12 @@ class CoachProfileNestedSerializer(serializers.ModelSerializer):
             "date_of_birth",
             "is_active",
             "created_at",
-        ]
+        )
 
 
-class PlayerProfileNestedSerializer(serializers.ModelSerializer):
+class PlayerProfileNestedSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     """
     Nested serializer for player profiles within academy details.
     """
@@ -91,7 +126,7 @@ class PlayerProfileNestedSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PlayerProfile
-        fields = [
+        fields = (
             "id",
             "user",
             "jersey_number",
@@ -105,26 +140,39 @@ class PlayerProfileNestedSerializer(serializers.ModelSerializer):
             "teams",
             "is_active",
             "created_at",
-        ]
+        )
 
     def get_parents(self, obj):
-        """Get parent information for the player."""
+        """
+        Get parent information for the player.
+
+        Reads the ``active_parents`` list prefetched by
+        AcademyDetailSerializer.prefetch_queryset() when available.
+        """
+        parents = getattr(obj, "active_parents", None)
+        if parents is None:
+            return _summary_rows(
+                obj.parents.filter(is_active=True), "id", "relationship"
+            )
         return [
             {
                 "id": parent.id,
-                "user": {
-                    "id": parent.user.id,
-                    "email": parent.user.email,
-                    "first_name": parent.user.first_name,
-                    "last_name": parent.user.last_name,
-                },
+                "user": _user_summary(parent.user),
                 "relationship": parent.relationship,
             }
-            for parent in obj.parents.filter(is_active=True)
+            for parent in parents
         ]
 
     def get_teams(self, obj):
-        """Get team information for the player."""
+        """
+        Get team information for the player.
+
+        Reads the ``active_teams`` list prefetched by
+        AcademyDetailSerializer.prefetch_queryset() when available.
+        """
+        teams = getattr(obj, "active_teams", None)
+        if teams is None:
+            teams = obj.teams.filter(is_active=True)
         return [
             {
                 "id": team.id,
@@ -132,11 +180,13 @@ class PlayerProfileNestedSerializer(serializers.ModelSerializer):
                 "age_group": team.age_group,
                 "formation": team.formation,
             }
-            for team in obj.teams.filter(is_active=True)
+            for team in teams
         ]
 
 
-class ParentProfileNestedSerializer(serializers.ModelSerializer):
+class ParentProfileNestedSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     """
     Nested serializer for parent profiles within academy details.
     """
@@ -146,7 +196,7 @@ class ParentProfileNestedSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ParentProfile
-        fields = [
+        fields = (
             "id",
             "user",
             "relationship",
@@ -155,27 +205,18 @@ class ParentProfileNestedSerializer(serializers.ModelSerializer):
             "children",
             "is_active",
             "created_at",
-        ]
+        )
 
     def get_children(self, obj):
         """Get children information for the parent."""
-        return [
-            {
-                "id": child.id,
-                "user": {
-                    "id": child.user.id,
-                    "email": child.user.email,
-                    "first_name": child.user.first_name,
-                    "last_name": child.user.last_name,
-                },
-                "jersey_number": child.jersey_number,
-                "position": child.position,
-            }
-            for child in obj.children.filter(is_active=True)
-        ]
+        return _summary_rows(
+            obj.children.filter(is_active=True), "id", "jersey_number", "position"
+        )
 
 
-class AcademyAdminProfileNestedSerializer(serializers.ModelSerializer):
+class AcademyAdminProfileNestedSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     """
     Nested serializer for academy admin profiles within academy details.
     """
@@ -184,7 +225,7 @@ class AcademyAdminProfileNestedSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AcademyAdminProfile
-        fields = [
+        fields = (
             "id",
             "user",
             "position",
@@ -192,10 +233,10 @@ class AcademyAdminProfileNestedSerializer(serializers.ModelSerializer):
             "date_of_birth",
             "is_active",
             "created_at",
-        ]
+        )
 
 
-class AcademyDetailSerializer(serializers.ModelSerializer):
+class AcademyDetailSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Detailed academy serializer with all nested objects.
     Used for retrieve operations to provide comprehensive academy information.
@@ -212,7 +253,7 @@ class AcademyDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Academy
-        fields = [
+        fields = (
             "id",
             "name",
             "name_ar",
@@ -232,197 +273,247 @@ class AcademyDetailSerializer(serializers.ModelSerializer):
             "teams",
             "academy_fields",
             "statistics",
-        ]
+        )
+
+    # Upcoming bookings listed per field, and how many days ahead they are read
+    UPCOMING_BOOKINGS_LIMIT = 5
+    UPCOMING_BOOKINGS_DAYS = 7
+
+    @classmethod
+    def upcoming_bookings(cls, bookings):
+        """Filter ``bookings`` to the upcoming ones listed for a field."""
+        now = timezone.now()
+        return (
+            bookings.filter(
+                start_time__gte=now,
+                start_time__lte=now + timedelta(days=cls.UPCOMING_BOOKINGS_DAYS),
+                status__in=["confirmed", "pending"],
+            )
+            .select_related("booked_by")
+            .order_by("start_time")
+        )
+
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """
+        Prefetch everything the serializer reads from an academy queryset.
+
+        Active teams and their active players, and each player's active
+        parents and teams, are read from the ``active_*`` lists prefetched
+        below; instances loaded without them fall back to a query per
+        relation.
+        """
+        # The summary lists only load the columns they emit
+        user_columns = [f"user__{name}" for name in USER_SUMMARY_FIELDS]
+        active_players = (
+            PlayerProfile.objects.filter(is_active=True)
+            .select_related("user")
+            .only("polymorphic_ctype", "jersey_number", "position", *user_columns)
+        )
+        active_teams = (
+            Team.objects.filter(is_active=True)
+            .select_related("coach__user")
+            .only(
+                "academy",
+                "name",
+                "age_group",
+                "formation",
+                "is_active",
+                "created_at",
+                "coach__polymorphic_ctype",
+                "coach__is_active",
+                "coach__specialization",
+                "coach__experience_years",
+                *[f"coach__{column}" for column in user_columns],
+            )
+            .prefetch_related(
+                Prefetch("players", queryset=active_players, to_attr="active_players")
+            )
+        )
+        active_parents = (
+            ParentProfile.objects.filter(is_active=True)
+            .select_related("user")
+            .only("polymorphic_ctype", "relationship", *user_columns)
+        )
+        player_teams = Team.objects.filter(is_active=True).only(
+            "name", "age_group", "formation"
+        )
+
+        def members(model):
+            # BaseUserSerializer reads every user column but the password hash
+            return model.objects.select_related("user").defer("user__password")
+
+        # The sliced prefetch is limited per field with a ROW_NUMBER() window
+        upcoming_bookings = cls.upcoming_bookings(FieldBooking.objects).only(
+            "field",
+            "start_time",
+            "end_time",
+            "status",
+            *[f"booked_by__{name}" for name in USER_SUMMARY_FIELDS],
+        )[: cls.UPCOMING_BOOKINGS_LIMIT]
+        active_fields = Field.objects.filter(is_active=True).prefetch_related(
+            Prefetch(
+                "bookings",
+                queryset=upcoming_bookings,
+                to_attr="upcoming_bookings_list",
+            )
+        )
+        # The active_*_count columns only feed the list's basic_statistics
+        return queryset.defer(*ACTIVE_COUNT_FIELDS.values()).prefetch_related(
+            Prefetch("admins", members(AcademyAdminProfile)),
+            Prefetch("coaches", members(CoachProfile)),
+            Prefetch("players", members(PlayerProfile)),
+            Prefetch(
+                "players__parents", queryset=active_parents, to_attr="active_parents"
+            ),
+            Prefetch("players__teams", queryset=player_teams, to_attr="active_teams"),
+            Prefetch("fields", queryset=active_fields, to_attr="active_fields"),
+            Prefetch("teams", queryset=active_teams, to_attr="active_teams"),
+        )
 
     def get_teams(self, obj):
-        """Get teams information for the academy."""
-        try:
-            # Try to get teams from the related manager
-            teams_queryset = getattr(obj, "teams", obj.team_set).filter(is_active=True)
-
-            teams_data = []
-            for team in teams_queryset:
-                team_data = {
-                    "id": team.id,
-                    "name": team.name,
-                    "age_group": team.age_group,
-                    "formation": getattr(team, "formation", ""),
-                    "is_active": team.is_active,
-                    "created_at": team.created_at,
-                    "total_players": team.players.filter(is_active=True).count(),
+        """
+        Get teams information for the academy.
+
+        Reads the ``active_teams`` lists prefetched by prefetch_queryset()
+        and queries them when the instance was not loaded through it.
+        """
+        teams = getattr(obj, "active_teams", None)
+        if teams is None:
+            teams = obj.teams.filter(is_active=True).select_related("coach__user")
+        teams_data = []
+        for team in teams:
+            active_players = getattr(team, "active_players", None)
+            if active_players is None:
+                active_players = team.players.filter(is_active=True).select_related(
+                    "user"
+                )
+            players = [
+                {
+                    "id": player.id,
+                    "user": _user_summary(player.user),
+                    "jersey_number": player.jersey_number,
+                    "position": player.position,
                 }
+                for player in active_players
+            ]
+            team_data = {
+                "id": team.id,
+                "name": team.name,
+                "age_group": team.age_group,
+                "formation": team.formation,
+                "is_active": team.is_active,
+                "created_at": team.created_at,
+                "total_players": len(players),
+            }
 
-                # Add coach information if available
-                if hasattr(team, "coach") and team.coach and team.coach.is_active:
-                    team_data["coach"] = {
-                        "id": team.coach.id,
-                        "user": {
-                            "id": team.coach.user.id,
-                            "email": team.coach.user.email,
-                            "first_name": team.coach.user.first_name,
-                            "last_name": team.coach.user.last_name,
-                        },
-                        "specialization": team.coach.specialization,
-                        "experience_years": team.coach.experience_years,
-                    }
-                else:
-                    team_data["coach"] = None
+            # Add coach information if available; coach__user is selected
+            # with the team
+            coach = team.coach
+            if coach is not None and coach.is_active:
+                team_data["coach"] = {
+                    "id": coach.id,
+                    "user": _user_summary(coach.user),
+                    "specialization": coach.specialization,
+                    "experience_years": coach.experience_years,
+                }
+            else:
+                team_data["coach"] = None
 
-                # Add players information
-                team_data["players"] = [
+            team_data["players"] = players
+            teams_data.append(team_data)
+
+        return teams_data
+
+    def get_academy_fields(self, obj):
+        """
+        Get fields information for the academy.
+
+        Reads the ``active_fields`` and ``upcoming_bookings_list`` lists
+        prefetched by prefetch_queryset() and queries them when the instance
+        was not loaded through it.
+        """
+        fields = getattr(obj, "active_fields", None)
+        if fields is None:
+            fields = obj.fields.filter(is_active=True)
+        return [
+            {
+                "id": field.id,
+                "name": field.name,
+                "field_type": field.field_type,
+                "capacity": field.capacity,
+                "hourly_rate": str(field.hourly_rate),
+                "facilities": field.facilities,
+                "is_available": field.is_available,
+                "is_active": field.is_active,
+                "created_at": field.created_at,
+                # Add upcoming bookings
+                "upcoming_bookings": [
                     {
-                        "id": player.id,
-                        "user": {
-                            "id": player.user.id,
-                            "email": player.user.email,
-                            "first_name": player.user.first_name,
-                            "last_name": player.user.last_name,
-                        },
-                        "jersey_number": player.jersey_number,
-                        "position": player.position,
+                        "id": booking.id,
+                        "start_time": booking.start_time,
+                        "end_time": booking.end_time,
+                        "status": booking.status,
+                        "booked_by": _user_summary(booking.booked_by),
                     }
-                    for player in team.players.filter(is_active=True)
-                ]
-
-                teams_data.append(team_data)
+                    for booking in self.get_upcoming_bookings(field)
+                ],
+            }
+            for field in fields
+        ]
 
-            return teams_data
-        except Exception:
-            return []
+    def get_upcoming_bookings(self, field):
+        """Return the upcoming bookings of a field, prefetched when available."""
+        bookings = getattr(field, "upcoming_bookings_list", None)
+        if bookings is None:
+            bookings = self.upcoming_bookings(field.bookings)[
+                : self.UPCOMING_BOOKINGS_LIMIT
+            ]
+        return bookings
 
-    def get_academy_fields(self, obj):
-        """Get fields information for the academy."""
-        try:
-            fields_data = []
-            for field in obj.fields.filter(is_active=True):
-                field_data = {
-                    "id": field.id,
-                    "name": field.name,
-                    "field_type": field.field_type,
-                    "capacity": field.capacity,
-                    "hourly_rate": str(field.hourly_rate),
-                    "facilities": field.facilities,
-                    "is_available": field.is_available,
-                    "is_active": field.is_active,
-                    "created_at": field.created_at,
-                }
+    # Admin and parent counts are not tracked by the academies signals, so
+    # they are only cached briefly
+    MEMBER_COUNTS_CACHE_TIMEOUT = 60
 
-                # Add upcoming bookings
-                try:
-                    from datetime import timedelta
-
-                    from django.utils import timezone
-
-                    # Get bookings for the next 7 days
-                    end_date = timezone.now() + timedelta(days=7)
-                    upcoming = field.bookings.filter(
-                        start_time__gte=timezone.now(),
-                        start_time__lte=end_date,
-                        status__in=["confirmed", "pending"],
-                    ).order_by("start_time")[
-                        :5
-                    ]  # Limit to 5 upcoming bookings
-
-                    field_data["upcoming_bookings"] = [
-                        {
-                            "id": booking.id,
-                            "start_time": booking.start_time,
-                            "end_time": booking.end_time,
-                            "status": booking.status,
-                            "booked_by": {
-                                "id": booking.booked_by.id,
-                                "email": booking.booked_by.email,
-                                "first_name": booking.booked_by.first_name,
-                                "last_name": booking.booked_by.last_name,
-                            },
-                        }
-                        for booking in upcoming
-                    ]
-                except Exception:
-                    field_data["upcoming_bookings"] = []
-
-                fields_data.append(field_data)
-
-            return fields_data
-        except Exception:
-            return []
+    @staticmethod
+    def member_counts_cache_key(obj):
+        """Return the cache key holding the admin and parent counts of obj."""
+        return f"academy:{obj.pk}:{int(obj.updated_at.timestamp())}:member_counts"
 
     def get_statistics(self, obj):
         """Get comprehensive statistics for the academy."""
-        # Get active counts
-        active_coaches = obj.coaches.filter(is_active=True)
-        active_players = obj.players.filter(is_active=True)
-        try:
-            active_teams = obj.teams.filter(is_active=True)
-        except Exception:
-            active_teams = []
-        active_fields = obj.fields.filter(is_active=True)
-
-        # Get parents count (related through players)
-        parent_ids = set()
-        for player in active_players:
-            for parent in player.parents.filter(is_active=True):
-                parent_ids.add(parent.id)
+        statistics = obj.statistics
+        counts = cache.get_or_set(
+            self.member_counts_cache_key(obj),
+            lambda: (
+                Academy.objects.filter(pk=obj.pk)
+                .with_active_counts("admins")
+                .with_parent_count()
+                .values("total_admins", "total_parents")
+                .get()
+            ),
+            self.MEMBER_COUNTS_CACHE_TIMEOUT,
+        )
+        field_type_labels = dict(Field.FIELD_TYPES)
 
         return {
-            "total_admins": obj.admins.filter(is_active=True).count(),
-            "total_coaches": active_coaches.count(),
-            "total_players": active_players.count(),
-            "total_parents": len(parent_ids),
-            "total_teams": len(active_teams)
-            if hasattr(active_teams, "__len__")
-            else active_teams.count(),
-            "total_fields": active_fields.count(),
-            "coaches_by_specialization": self._get_coaches_by_specialization(
-                active_coaches
-            ),
-            "players_by_position": self._get_players_by_position(active_players),
-            "teams_by_age_group": self._get_teams_by_age_group(active_teams),
-            "fields_by_type": self._get_fields_by_type(active_fields),
+            "total_admins": counts["total_admins"],
+            "total_coaches": statistics["total_coaches"],
+            "total_players": statistics["total_players"],
+            "total_parents": counts["total_parents"],
+            "total_teams": statistics["total_teams"],
+            "total_fields": statistics["total_fields"],
+            "coaches_by_specialization": statistics["coaches_by_specialization"],
+            "players_by_position": statistics["players_by_position"],
+            "teams_by_age_group": statistics["teams_by_age_group"],
+            "fields_by_type": {
+                field_type_labels.get(field_type, field_type): total
+                for field_type, total in statistics["fields_by_type"].items()
+            },
         }
 
-    def _get_coaches_by_specialization(self, coaches):
-        """Group coaches by specialization."""
-        specializations = {}
-        for coach in coaches:
-            spec = coach.specialization or "Not Specified"
-            specializations[spec] = specializations.get(spec, 0) + 1
-        return specializations
-
-    def _get_players_by_position(self, players):
-        """Group players by position."""
-        positions = {}
-        for player in players:
-            pos = player.position or "Not Specified"
-            positions[pos] = positions.get(pos, 0) + 1
-        return positions
-
-    def _get_teams_by_age_group(self, teams):
-        """Group teams by age group."""
-        age_groups = {}
-        try:
-            for team in teams:
-                age = getattr(team, "age_group", None) or "Not Specified"
-                age_groups[age] = age_groups.get(age, 0) + 1
-        except Exception:
-            pass
-        return age_groups
-
-    def _get_fields_by_type(self, fields):
-        """Group fields by type."""
-        field_types = {}
-        try:
-            for field in fields:
-                field_type = getattr(
-                    field, "get_field_type_display", lambda: field.field_type
-                )()
-                field_types[field_type] = field_types.get(field_type, 0) + 1
-        except Exception:
-            pass
-        return field_types
-
-
-class AcademySerializer(serializers.ModelSerializer):
+
+class AcademySerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Basic academy serializer for list operations.
     Does not include nested objects for performance.
@@ -432,7 +523,7 @@ class AcademySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Academy
-        fields = [
+        fields = (
             "id",
             "name",
             "name_ar",
@@ -447,19 +538,16 @@ class AcademySerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "basic_statistics",
-        ]
+        )
 
     def get_basic_statistics(self, obj):
         """Get basic count statistics for the academy."""
-        return {
-            "total_coaches": obj.coaches.filter(is_active=True).count(),
-            "total_players": obj.players.filter(is_active=True).count(),
-            "total_teams": obj.teams.filter(is_active=True).count(),
-            "total_fields": obj.fields.filter(is_active=True).count(),
-        }
+        return obj.basic_statistics
 
 
-class AcademyAdminProfileSerializer(serializers.ModelSerializer):
+class AcademyAdminProfileSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     """
     Serializer for academy admin profiles with nested user creation.
     """
@@ -471,7 +559,7 @@ class AcademyAdminProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AcademyAdminProfile
-        fields = [
+        fields = (
             "id",
             "user",
             "user_email",
@@ -484,8 +572,8 @@ class AcademyAdminProfileSerializer(serializers.ModelSerializer):
             "is_active",
             "created_at",
             "updated_at",
-        ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        )
+        read_only_fields = ("id", "created_at", "updated_at")
 
     def validate(self, attrs):
         # If user data is provided, ensure user_type is 'academy_admin'
@@ -535,7 +623,9 @@ class AcademyAdminProfileSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class ExternalClientProfileSerializer(serializers.ModelSerializer):
+class ExternalClientProfileSerializer(
+    CachedFieldsSerializerMixin, serializers.ModelSerializer
+):
     """
     Serializer for external client profiles with nested user creation.
     """
@@ -546,7 +636,7 @@ class ExternalClientProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ExternalClientProfile
-        fields = [
+        fields = (
             "id",
             "user",
             "user_email",
@@ -558,8 +648,8 @@ class ExternalClientProfileSerializer(serializers.ModelSerializer):
             "is_active",
             "created_at",
             "updated_at",
-        ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        )
+        read_only_fields = ("id", "created_at", "updated_at")
 
     def validate(self, attrs):
         # If user data is provided, ensure user_type is 'external_client'
@@ -0,0 +1,99 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .models import Academy, CoachProfile, PlayerProfile
+
+# Models whose rows feed Academy.statistics and the active_*_count columns
+STATISTICS_SOURCES = (CoachProfile, PlayerProfile, "players.Team", "bookings.Field")
+
+# Columns whose change moves a row in or out of an academy's counters
+COUNTED_FIELDS = ("academy_id", "is_active")
+
+# Academy relation -> column its statistics histogram is grouped by
+GROUPED_FIELDS = dict(Academy.STATISTICS_HISTOGRAMS.values())
+
+
+def academy_relation(sender):
+    """Return the name of the Academy reverse relation ``sender`` rows feed."""
+    return sender._meta.get_field("academy").remote_field.related_name
+
+
+def statistics_fields(sender):
+    """
+    Return the columns of ``sender`` that Academy.statistics depends on.
+
+    These are the counted columns plus the column the relation's histogram is
+    grouped by.
+    """
+    return (*COUNTED_FIELDS, GROUPED_FIELDS[academy_relation(sender)])
+
+
+def remember_previous_state(sender, instance, **kwargs):
+    """
+    Record the statistics columns of the row before this save.
+
+    A row moved to another academy has to be taken out of the old academy's
+    counters as well, and a save that changes none of the columns leaves the
+    counters and the cached statistics alone.
+    """
+    instance._previous_state = (
+        sender._base_manager.filter(pk=instance.pk)
+        .values(*statistics_fields(sender))
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+def refresh_academies(sender, academy_ids, recount):
+    """
+    Drop the cached statistics of the academies, recounting first if asked.
+
+    The counter is recounted rather than shifted by a delta, so it cannot
+    drift. Bulk ``QuerySet.update()`` calls do not send signals; run the
+    recompute_academy_counters command after those.
+    """
+    academy_ids = set(academy_ids) - {None}
+    if not academy_ids:
+        return
+
+    if recount:
+        Academy.objects.filter(pk__in=academy_ids).refresh_active_counts(
+            academy_relation(sender)
+        )
+    for academy_id in academy_ids:
+        Academy.invalidate_statistics(academy_id)
+
+
+def refresh_academy_statistics_on_save(sender, instance, created, **kwargs):
+    """
+    Refresh the academies of a saved row.
+
+    Nothing is done unless a column Academy.statistics depends on changed;
+    the counters are recounted only when the row was counted differently.
+    """
+    previous = instance.__dict__.pop("_previous_state", None)
+    if created or previous is None:
+        refresh_academies(sender, {instance.academy_id}, recount=True)
+        return
+
+    changed = {
+        field for field, value in previous.items() if value != getattr(instance, field)
+    }
+    if not changed:
+        return
+
+    recount = not changed.isdisjoint(COUNTED_FIELDS)
+    refresh_academies(
+        sender, {instance.academy_id, previous["academy_id"]}, recount=recount
+    )
+
+
+def refresh_academy_statistics_on_delete(sender, instance, **kwargs):
+    """Recount the academy of a deleted row."""
+    refresh_academies(sender, {instance.academy_id}, recount=True)
+
+
+for source in STATISTICS_SOURCES:
+    pre_save.connect(remember_previous_state, sender=source)
+    post_save.connect(refresh_academy_statistics_on_save, sender=source)
+    post_delete.connect(refresh_academy_statistics_on_delete, sender=source)
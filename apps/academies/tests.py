@@ -0,0 +1,235 @@
+from decimal import Decimal
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.academies.models import Academy, ParentChild
+from apps.academies.serializers import AcademyDetailSerializer
+from apps.bookings.models import Field
+from apps.core.models import User
+from apps.players.models import Team
+
+
+class AcademyAdminTests(TestCase):
+    """Tests for the academy admin changelists."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            email="root@example.com",
+            password="password",
+            first_name="Root",
+            last_name="User",
+        )
+        cls.academy = Academy.objects.create(
+            name="Cairo Football Academy",
+            name_ar="Cairo Football Academy",
+            address="Address",
+            phone="0201234567",
+            email="info@academy.com",
+        )
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def test_academy_search_matches_exact_email(self):
+        response = self.client.get(
+            "/admin/academies/academy/", {"q": "info@academy.com"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["cl"].result_list), [self.academy])
+
+    def test_academy_changelist_labels_logo_column(self):
+        response = self.client.get("/admin/academies/academy/")
+
+        self.assertContains(response, "<span>Logo</span>", html=True)
+
+    def test_logo_preview_url_is_percent_encoded(self):
+        self.academy.logo.name = "academies/logos/my logo#1.png"
+
+        preview = admin.site._registry[Academy].image_preview(self.academy)
+
+        self.assertIn(default_storage.url(self.academy.logo.name), preview)
+
+    def test_player_search_ignores_digit_like_characters(self):
+        response = self.client.get("/admin/academies/playerprofile/", {"q": "²"})
+
+        self.assertEqual(response.status_code, 200)
+
+    def create_profile(self, email, user_type):
+        user = User.objects.create_user(
+            email=email,
+            password="password",
+            user_type=user_type,
+            first_name="First",
+            last_name="Last",
+        )
+        return user.profile
+
+    def test_parent_change_form_queries_do_not_grow_with_children(self):
+        parent = self.create_profile("parent@example.com", "parent")
+        url = f"/admin/academies/parentprofile/{parent.pk}/change/"
+
+        def change_form_queries():
+            self.client.get(url)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        ParentChild.objects.create(
+            parent=parent, child=self.create_profile("child0@example.com", "player")
+        )
+        one_child = change_form_queries()
+        for number in (1, 2):
+            ParentChild.objects.create(
+                parent=parent,
+                child=self.create_profile(f"child{number}@example.com", "player"),
+            )
+
+        self.assertEqual(change_form_queries(), one_child)
+
+
+class AcademyStatisticsSignalTests(TestCase):
+    """Tests for the signals keeping the academy counters current."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.academy = Academy.objects.create(
+            name="Academy",
+            name_ar="Academy",
+            address="Address",
+            phone="123",
+            email="academy@example.com",
+        )
+        cls.user = User.objects.create_user(
+            email="coach@example.com",
+            password="password",
+            user_type="coach",
+            first_name="Coach",
+            last_name="User",
+        )
+        coach = cls.user.profile
+        coach.academy = cls.academy
+        coach.specialization = "GK"
+        coach.save()
+
+    def setUp(self):
+        cache.clear()
+
+    def academy_updates(self, queries):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "academies_academy"')
+        ]
+
+    def test_user_login_does_not_update_academy(self):
+        user = User.objects.get(pk=self.user.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            user.last_login = timezone.now()
+            user.save(update_fields=["last_login"])
+
+        self.assertEqual(self.academy_updates(queries), [])
+
+    def test_deactivating_coach_recounts_academy(self):
+        coach = User.objects.get(pk=self.user.pk).profile
+        self.academy.refresh_from_db()
+        self.assertEqual(self.academy.active_coach_count, 1)
+
+        coach.is_active = False
+        coach.save()
+
+        self.academy.refresh_from_db()
+        self.assertEqual(self.academy.active_coach_count, 0)
+
+    def test_user_login_keeps_cached_statistics(self):
+        self.academy.statistics
+        user = User.objects.get(pk=self.user.pk)
+
+        user.last_login = timezone.now()
+        user.save(update_fields=["last_login"])
+
+        self.assertIsNotNone(cache.get(Academy.statistics_cache_key(self.academy.pk)))
+
+    def test_changing_specialization_drops_cached_statistics(self):
+        self.academy.statistics
+        coach = User.objects.get(pk=self.user.pk).profile
+
+        coach.specialization = "Fitness"
+        coach.save()
+
+        self.assertIsNone(cache.get(Academy.statistics_cache_key(self.academy.pk)))
+
+    def test_saving_stale_academy_keeps_counters(self):
+        stale = Academy.objects.get(pk=self.academy.pk)
+        user = User.objects.create_user(
+            email="coach2@example.com",
+            password="password",
+            user_type="coach",
+            first_name="Second",
+            last_name="Coach",
+        )
+        coach = user.profile
+        coach.academy = self.academy
+        coach.save()
+
+        stale.name = "Renamed Academy"
+        stale.save()
+
+        self.academy.refresh_from_db()
+        self.assertEqual(self.academy.name, "Renamed Academy")
+        self.assertEqual(self.academy.active_coach_count, 2)
+
+
+class AcademyDetailSerializerTests(TestCase):
+    """Tests for the comprehensive academy serializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.academy = Academy.objects.create(
+            name="Academy",
+            name_ar="Academy",
+            address="Address",
+            phone="123",
+            email="academy@example.com",
+        )
+        user = User.objects.create_user(
+            email="player@example.com",
+            password="password",
+            user_type="player",
+            first_name="Player",
+            last_name="User",
+        )
+        player = user.profile
+        player.academy = cls.academy
+        player.save()
+        team = Team.objects.create(name="Team", academy=cls.academy, age_group="U16")
+        team.players.add(player)
+        Field.objects.create(
+            academy=cls.academy,
+            name="Field",
+            field_type="football",
+            capacity=10,
+            hourly_rate=Decimal("10.00"),
+        )
+
+    def test_serializes_academy_loaded_without_prefetch(self):
+        prefetched = AcademyDetailSerializer.prefetch_queryset(
+            Academy.objects.filter(pk=self.academy.pk)
+        ).get()
+
+        data = AcademyDetailSerializer(Academy.objects.get(pk=self.academy.pk)).data
+
+        self.assertEqual(
+            data["teams"], AcademyDetailSerializer(prefetched).data["teams"]
+        )
+        self.assertEqual(len(data["teams"][0]["players"]), 1)
+        self.assertEqual(len(data["academy_fields"]), 1)
@@ -6,7 +6,7 @@ academy-related operations with atomic transaction support.
 
 import logging
 
-from django.db import transaction
+from django.utils.cache import get_conditional_response, set_response_etag
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
@@ -15,6 +15,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from apps.core.permissions import IsAcademyAdmin, IsSystemAdmin
+from apps.core.renderers import ORJSONRenderer
 from apps.core.views import BaseModelViewSet
 
 from .models import Academy, AcademyAdminProfile, ExternalClientProfile
@@ -27,6 +28,134 @@ from .serializers import (
 
 logger = logging.getLogger(__name__)
 
+ACADEMY_DETAIL_RESPONSE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "name": openapi.Schema(type=openapi.TYPE_STRING),
+        "name_ar": openapi.Schema(type=openapi.TYPE_STRING),
+        "description": openapi.Schema(type=openapi.TYPE_STRING),
+        "logo": openapi.Schema(type=openapi.TYPE_STRING),
+        "address": openapi.Schema(type=openapi.TYPE_STRING),
+        "phone": openapi.Schema(type=openapi.TYPE_STRING),
+        "email": openapi.Schema(type=openapi.TYPE_STRING),
+        "website": openapi.Schema(type=openapi.TYPE_STRING),
+        "established_date": openapi.Schema(
+            type=openapi.TYPE_STRING, format=openapi.FORMAT_DATE
+        ),
+        "is_active": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+        "created_at": openapi.Schema(
+            type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME
+        ),
+        "updated_at": openapi.Schema(
+            type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME
+        ),
+        "admins": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "user": openapi.Schema(type=openapi.TYPE_OBJECT),
+                    "position": openapi.Schema(type=openapi.TYPE_STRING),
+                    "bio": openapi.Schema(type=openapi.TYPE_STRING),
+                },
+            ),
+        ),
+        "coaches": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "user": openapi.Schema(type=openapi.TYPE_OBJECT),
+                    "specialization": openapi.Schema(type=openapi.TYPE_STRING),
+                    "experience_years": openapi.Schema(type=openapi.TYPE_INTEGER),
+                },
+            ),
+        ),
+        "players": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "user": openapi.Schema(type=openapi.TYPE_OBJECT),
+                    "jersey_number": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "position": openapi.Schema(type=openapi.TYPE_STRING),
+                    "parents": openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                    ),
+                    "teams": openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                    ),
+                },
+            ),
+        ),
+        "teams": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "name": openapi.Schema(type=openapi.TYPE_STRING),
+                    "age_group": openapi.Schema(type=openapi.TYPE_STRING),
+                    "coach": openapi.Schema(type=openapi.TYPE_OBJECT),
+                    "players": openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                    ),
+                    "total_players": openapi.Schema(type=openapi.TYPE_INTEGER),
+                },
+            ),
+        ),
+        "fields": openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "name": openapi.Schema(type=openapi.TYPE_STRING),
+                    "field_type": openapi.Schema(type=openapi.TYPE_STRING),
+                    "capacity": openapi.Schema(type=openapi.TYPE_INTEGER),
+                    "upcoming_bookings": openapi.Schema(
+                        type=openapi.TYPE_ARRAY,
+                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                    ),
+                },
+            ),
+        ),
+        "statistics": openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "total_admins": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "total_coaches": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "total_players": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "total_parents": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "total_teams": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "total_fields": openapi.Schema(type=openapi.TYPE_INTEGER),
+                "coaches_by_specialization": openapi.Schema(type=openapi.TYPE_OBJECT),
+                "players_by_position": openapi.Schema(type=openapi.TYPE_OBJECT),
+                "teams_by_age_group": openapi.Schema(type=openapi.TYPE_OBJECT),
+                "fields_by_type": openapi.Schema(type=openapi.TYPE_OBJECT),
+            },
+        ),
+    },
+)
+
+ACADEMY_STATISTICS_RESPONSE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "total_coaches": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "total_players": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "total_parents": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "total_teams": openapi.Schema(type=openapi.TYPE_INTEGER),
+        "total_fields": openapi.Schema(type=openapi.TYPE_INTEGER),
+    },
+)
+
 
 class AcademyViewSet(BaseModelViewSet):
     """
@@ -44,12 +173,13 @@ class AcademyViewSet(BaseModelViewSet):
     partial_update: Partially updates academy data (SYSTEM ADMIN ONLY)
     destroy: Deletes an academy (SYSTEM ADMIN ONLY)
 
-    All database operations are executed atomically to ensure data consistency.
+    All write operations are executed atomically to ensure data consistency.
     """
 
     queryset = Academy.objects.all()
     serializer_class = AcademySerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer]
     search_fields = ["name", "name_ar", "email", "phone"]
     filterset_fields = ["is_active"]
     ordering = ["name"]
@@ -72,26 +202,26 @@ class AcademyViewSet(BaseModelViewSet):
         queryset = super().get_queryset()
         user = self.request.user
 
+        if user.user_type != "system_admin":
+            academy_id = user.academy_id
+            if academy_id is None:
+                # External clients and users without academy profiles see no
+                # academies, so skip building the prefetches below
+                return queryset.none()
+            # Academy users can only see their own academy
+            queryset = queryset.filter(id=academy_id)
+
         # Add prefetch_related for detailed retrieval
         if self.action == "retrieve":
-            queryset = queryset.prefetch_related(
-                "admins__user",
-                "coaches__user",
-                "players__user",
-                "players__parents__user",
-                "players__teams",
-                "fields__bookings__booked_by",
-            ).select_related()
+            queryset = AcademyDetailSerializer.prefetch_queryset(queryset)
+        elif self.action == "statistics":
+            queryset = queryset.with_parent_count()
+        elif self.action in ("update", "partial_update", "destroy", "toggle_active"):
+            # Lock the row for the atomic block BaseModelViewSet opens around
+            # writes; skip_locked would report a locked academy as not found
+            queryset = queryset.select_for_update()
 
-        if user.user_type == "system_admin":
-            # System admins can see all academies
-            return queryset
-        elif hasattr(user, "profile") and hasattr(user.profile, "academy"):
-            # Academy users can only see their own academy
-            return queryset.filter(id=user.profile.academy.id)
-        else:
-            # External clients and users without academy profiles see no academies
-            return queryset.none()
+        return queryset
 
     def get_permissions(self):
         """
@@ -106,6 +236,23 @@ class AcademyViewSet(BaseModelViewSet):
             self.permission_classes = [IsAuthenticated]
         return super().get_permissions()
 
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Answer conditional academy retrieves with 304 Not Modified.
+
+        The detail payload also depends on rows that do not touch
+        Academy.updated_at (members, bookings, users), so the ETag is taken
+        from the rendered body rather than from the academy's timestamps.
+        """
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.action == "retrieve" and response.status_code == status.HTTP_200_OK:
+            response.render()
+            set_response_etag(response)
+            return get_conditional_response(
+                request, etag=response["ETag"], response=response
+            )
+        return response
+
     @swagger_auto_schema(
         operation_summary="List academies",
         operation_description="Returns a paginated list of academies based on user permissions. System admins see all academies, academy users see only their academy.",
@@ -123,160 +270,7 @@ class AcademyViewSet(BaseModelViewSet):
         responses={
             200: openapi.Response(
                 description="Comprehensive academy details with all nested objects",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "id": openapi.Schema(type=openapi.TYPE_INTEGER),
-                        "name": openapi.Schema(type=openapi.TYPE_STRING),
-                        "name_ar": openapi.Schema(type=openapi.TYPE_STRING),
-                        "description": openapi.Schema(type=openapi.TYPE_STRING),
-                        "logo": openapi.Schema(type=openapi.TYPE_STRING),
-                        "address": openapi.Schema(type=openapi.TYPE_STRING),
-                        "phone": openapi.Schema(type=openapi.TYPE_STRING),
-                        "email": openapi.Schema(type=openapi.TYPE_STRING),
-                        "website": openapi.Schema(type=openapi.TYPE_STRING),
-                        "established_date": openapi.Schema(
-                            type=openapi.TYPE_STRING, format=openapi.FORMAT_DATE
-                        ),
-                        "is_active": openapi.Schema(type=openapi.TYPE_BOOLEAN),
-                        "created_at": openapi.Schema(
-                            type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME
-                        ),
-                        "updated_at": openapi.Schema(
-                            type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME
-                        ),
-                        "admins": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
-                                    "user": openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    "position": openapi.Schema(
-                                        type=openapi.TYPE_STRING
-                                    ),
-                                    "bio": openapi.Schema(type=openapi.TYPE_STRING),
-                                },
-                            ),
-                        ),
-                        "coaches": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
-                                    "user": openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    "specialization": openapi.Schema(
-                                        type=openapi.TYPE_STRING
-                                    ),
-                                    "experience_years": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER
-                                    ),
-                                },
-                            ),
-                        ),
-                        "players": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
-                                    "user": openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    "jersey_number": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER
-                                    ),
-                                    "position": openapi.Schema(
-                                        type=openapi.TYPE_STRING
-                                    ),
-                                    "parents": openapi.Schema(
-                                        type=openapi.TYPE_ARRAY,
-                                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    ),
-                                    "teams": openapi.Schema(
-                                        type=openapi.TYPE_ARRAY,
-                                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    ),
-                                },
-                            ),
-                        ),
-                        "teams": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
-                                    "name": openapi.Schema(type=openapi.TYPE_STRING),
-                                    "age_group": openapi.Schema(
-                                        type=openapi.TYPE_STRING
-                                    ),
-                                    "coach": openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    "players": openapi.Schema(
-                                        type=openapi.TYPE_ARRAY,
-                                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    ),
-                                    "total_players": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER
-                                    ),
-                                },
-                            ),
-                        ),
-                        "fields": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
-                                    "name": openapi.Schema(type=openapi.TYPE_STRING),
-                                    "field_type": openapi.Schema(
-                                        type=openapi.TYPE_STRING
-                                    ),
-                                    "capacity": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER
-                                    ),
-                                    "upcoming_bookings": openapi.Schema(
-                                        type=openapi.TYPE_ARRAY,
-                                        items=openapi.Schema(type=openapi.TYPE_OBJECT),
-                                    ),
-                                },
-                            ),
-                        ),
-                        "statistics": openapi.Schema(
-                            type=openapi.TYPE_OBJECT,
-                            properties={
-                                "total_admins": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER
-                                ),
-                                "total_coaches": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER
-                                ),
-                                "total_players": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER
-                                ),
-                                "total_parents": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER
-                                ),
-                                "total_teams": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER
-                                ),
-                                "total_fields": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER
-                                ),
-                                "coaches_by_specialization": openapi.Schema(
-                                    type=openapi.TYPE_OBJECT
-                                ),
-                                "players_by_position": openapi.Schema(
-                                    type=openapi.TYPE_OBJECT
-                                ),
-                                "teams_by_age_group": openapi.Schema(
-                                    type=openapi.TYPE_OBJECT
-                                ),
-                                "fields_by_type": openapi.Schema(
-                                    type=openapi.TYPE_OBJECT
-                                ),
-                            },
-                        ),
-                    },
-                ),
+                schema=ACADEMY_DETAIL_RESPONSE_SCHEMA,
             ),
             401: "Unauthorized - authentication required",
             404: "Not found - academy does not exist",
@@ -286,17 +280,13 @@ class AcademyViewSet(BaseModelViewSet):
         """
         Retrieve academy with all nested objects and comprehensive information.
         """
-        try:
-            response = super().retrieve(request, *args, **kwargs)
-            academy_id = kwargs.get("pk")
-            logger.info(
-                f"Retrieved comprehensive academy details for academy {academy_id} "
-                f"by user {request.user.email}"
-            )
-            return response
-        except Exception as e:
-            logger.error(f"Error retrieving academy details: {str(e)}")
-            raise
+        # Errors propagate to the DRF exception handler, which logs them
+        response = super().retrieve(request, *args, **kwargs)
+        logger.info(
+            f"Retrieved comprehensive academy details for academy {kwargs.get('pk')} "
+            f"by user {request.user.email}"
+        )
+        return response
 
     @swagger_auto_schema(
         operation_summary="Create new academy",
@@ -358,16 +348,7 @@ class AcademyViewSet(BaseModelViewSet):
         responses={
             200: openapi.Response(
                 description="Academy statistics",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "total_coaches": openapi.Schema(type=openapi.TYPE_INTEGER),
-                        "total_players": openapi.Schema(type=openapi.TYPE_INTEGER),
-                        "total_parents": openapi.Schema(type=openapi.TYPE_INTEGER),
-                        "total_teams": openapi.Schema(type=openapi.TYPE_INTEGER),
-                        "total_fields": openapi.Schema(type=openapi.TYPE_INTEGER),
-                    },
-                ),
+                schema=ACADEMY_STATISTICS_RESPONSE_SCHEMA,
             ),
             401: "Unauthorized - authentication required",
             404: "Not found - academy does not exist",
@@ -379,15 +360,14 @@ class AcademyViewSet(BaseModelViewSet):
         Get statistics for a specific academy.
         """
         academy = self.get_object()
+        basic_statistics = academy.basic_statistics
 
         stats = {
-            "total_coaches": academy.coaches.filter(is_active=True).count(),
-            "total_players": academy.players.filter(is_active=True).count(),
-            "total_parents": academy.parents.filter(is_active=True).count(),
-            "total_teams": getattr(academy, "teams", academy.team_set)
-            .filter(is_active=True)
-            .count(),
-            "total_fields": academy.fields.filter(is_active=True).count(),
+            "total_coaches": basic_statistics["total_coaches"],
+            "total_players": basic_statistics["total_players"],
+            "total_parents": academy.total_parents,
+            "total_teams": basic_statistics["total_teams"],
+            "total_fields": basic_statistics["total_fields"],
         }
 
         logger.info(f"Retrieved statistics for academy {academy.id}")
@@ -405,7 +385,7 @@ class AcademyAdminProfileViewSet(BaseModelViewSet):
     partial_update: Partially updates admin profile data
     destroy: Deletes an admin profile
 
-    All database operations are executed atomically to ensure data consistency.
+    All write operations are executed atomically to ensure data consistency.
     """
 
     queryset = AcademyAdminProfile.objects.all()
@@ -433,13 +413,19 @@ class AcademyAdminProfileViewSet(BaseModelViewSet):
         """
         Return profiles based on user permissions.
         """
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().select_related("user", "academy")
         user = self.request.user
 
+        if self.action == "list":
+            # Listed profiles never read the user's password hash
+            queryset = queryset.defer("user__password")
+
         if user.user_type == "system_admin":
             return queryset
-        elif hasattr(user, "profile") and hasattr(user.profile, "academy"):
-            return queryset.filter(academy=user.profile.academy)
+
+        academy_id = user.academy_id
+        if academy_id is not None:
+            return queryset.filter(academy_id=academy_id)
 
         return queryset.none()
 
@@ -534,7 +520,7 @@ class ExternalClientProfileViewSet(BaseModelViewSet):
     partial_update: Partially updates external client profile data
     destroy: Deletes an external client profile
 
-    All database operations are executed atomically to ensure data consistency.
+    All write operations are executed atomically to ensure data consistency.
     """
 
     queryset = ExternalClientProfile.objects.all()
@@ -620,8 +606,7 @@ class ExternalClientProfileViewSet(BaseModelViewSet):
         },
     )
     def create(self, request, *args, **kwargs):
-        with transaction.atomic():
-            return super().create(request, *args, **kwargs)
+        return super().create(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_summary="Update external client profile",
@@ -635,8 +620,7 @@ class ExternalClientProfileViewSet(BaseModelViewSet):
         },
     )
     def update(self, request, *args, **kwargs):
-        with transaction.atomic():
-            return super().update(request, *args, **kwargs)
+        return super().update(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_summary="Partially update external client profile",
@@ -650,8 +634,7 @@ class ExternalClientProfileViewSet(BaseModelViewSet):
         },
     )
     def partial_update(self, request, *args, **kwargs):
-        with transaction.atomic():
-            return super().partial_update(request, *args, **kwargs)
+        return super().partial_update(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_summary="Delete external client profile",
@@ -664,5 +647,4 @@ class ExternalClientProfileViewSet(BaseModelViewSet):
         },
     )
     def destroy(self, request, *args, **kwargs):
-        with transaction.atomic():
-            return super().destroy(request, *args, **kwargs)
+        return super().destroy(request, *args, **kwargs)
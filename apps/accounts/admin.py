@@ -1,11 +1,11 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from django.utils.html import format_html
 
+from apps.core.admin import ImagePreviewMixin
 from apps.core.models import User
 
 
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(ImagePreviewMixin, UserAdmin):
     """
     Custom admin for User model with extended fields and functionality.
     Enhances the default Django UserAdmin with custom fields and filters.
@@ -17,7 +17,7 @@ class CustomUserAdmin(UserAdmin):
         "first_name",
         "last_name",
         "user_type",
-        "avatar_preview",
+        "image_preview",
         "is_active",
     ]
     list_filter = ["is_active", "user_type", "is_staff", "is_superuser", "date_joined"]
@@ -63,16 +63,9 @@ class CustomUserAdmin(UserAdmin):
         ),
     )
 
-    def avatar_preview(self, obj):
-        """Display user avatar preview in admin"""
-        if obj.avatar:
-            return format_html(
-                '<img src="{}" style="max-height: 50px; max-width: 50px;"/>',
-                obj.avatar.url,
-            )
-        return "No Avatar"
-
-    avatar_preview.short_description = "Avatar"
+    image_field = "avatar"
+    no_image_text = "No Avatar"
+    image_preview_label = "Avatar"
 
 
 # Register the custom User admin
@@ -4,6 +4,7 @@ from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from apps.academies.models import (
+    Academy,
     AcademyAdminProfile,
     CoachProfile,
     ExternalClientProfile,
@@ -20,6 +21,14 @@ from apps.core.serializers import BaseUserSerializer
 
 User = get_user_model()
 
+# Map user types to their respective nested profile serializers
+PROFILE_SERIALIZERS = {
+    "parent": ParentProfileNestedSerializer,
+    "player": PlayerProfileNestedSerializer,
+    "coach": CoachProfileNestedSerializer,
+    "academy_admin": AcademyAdminProfileNestedSerializer,
+}
+
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
@@ -71,21 +80,12 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         Get profile data using appropriate nested serializer based on user type.
         """
         try:
-            if not hasattr(user, "profile") or not user.profile:
+            profile = getattr(user, "profile", None)
+            if profile is None:
                 return None
 
-            profile = user.profile
-
-            # Map user types to their respective nested serializers
-            profile_serializers = {
-                "parent": ParentProfileNestedSerializer,
-                "player": PlayerProfileNestedSerializer,
-                "coach": CoachProfileNestedSerializer,
-                "academy_admin": AcademyAdminProfileNestedSerializer,
-            }
-
             # Get the appropriate serializer for the user type
-            serializer_class = profile_serializers.get(user.user_type)
+            serializer_class = PROFILE_SERIALIZERS.get(user.user_type)
 
             if serializer_class:
                 serializer = serializer_class(profile)
@@ -167,9 +167,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop("password_confirm")
         password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
+        user = User.objects.create_user(password=password, **validated_data)
 
         # Profile will be created automatically by signals
         # No need to manually create profile here
@@ -221,30 +219,27 @@ class AcademyUserRegistrationSerializer(serializers.ModelSerializer):
                 }
             )
 
+        # Look the academy up before anything is written
+        try:
+            attrs["academy"] = Academy.objects.get(id=attrs.pop("academy_id"))
+        except Academy.DoesNotExist:
+            raise serializers.ValidationError({"academy_id": "Academy not found"})
+
         return attrs
 
     def create(self, validated_data):
-        academy_id = validated_data.pop("academy_id")
+        academy = validated_data.pop("academy")
         password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
+        user = User.objects.create_user(password=password, **validated_data)
 
         # Profile will be created automatically by signals
         # Now update the profile with academy association
-        self.associate_profile_with_academy(user, academy_id)
+        self.associate_profile_with_academy(user, academy)
 
         return user
 
-    def associate_profile_with_academy(self, user, academy_id):
+    def associate_profile_with_academy(self, user, academy):
         """Associate user profile with academy after creation"""
-        from apps.academies.models import Academy
-
-        try:
-            academy = Academy.objects.get(id=academy_id)
-        except Academy.DoesNotExist:
-            raise serializers.ValidationError({"academy_id": "Academy not found"})
-
         # Wait for profile to be created by signal, then update with academy
         if hasattr(user, "profile") and user.profile:
             profile = user.profile
@@ -112,9 +112,7 @@ class AnalyticsViewSet(BaseModelViewSet):
             "academy_name": academy.name,
             "total_players": academy.players.filter(is_active=True).count(),
             "total_coaches": academy.coaches.filter(is_active=True).count(),
-            "total_teams": getattr(academy, "teams", academy.team_set)
-            .filter(is_active=True)
-            .count(),
+            "total_teams": academy.teams.filter(is_active=True).count(),
             "total_matches": 0,  # Would implement actual match counting
             "total_fields": academy.fields.filter(is_active=True).count(),
             "active_bookings": 0,  # Would implement actual booking counting
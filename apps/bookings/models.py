@@ -40,6 +40,13 @@ class Field(BaseModel):
         """Return string representation of the field."""
         return f"{self.name} - {self.academy.name}"
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["academy", "is_active"], name="field_academy_active_idx"
+            ),
+        ]
+
 
 class FieldBooking(BaseModel):
     """
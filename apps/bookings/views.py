@@ -5,6 +5,7 @@ operations with atomic transaction support and email notifications.
 """
 
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 
 from django.db import transaction
@@ -449,12 +450,11 @@ class FieldViewSet(AcademyScopedViewSet):
 
         if queryset.exists():
             # Group bookings by hour to find peak times
-            for booking in queryset:
-                hour = booking.start_time.hour
-                hour_key = f"{hour:02d}:00-{(hour + 1):02d}:00"
-                if hour_key not in hour_bookings:
-                    hour_bookings[hour_key] = 0
-                hour_bookings[hour_key] += 1
+            hours = Counter(booking.start_time.hour for booking in queryset)
+            hour_bookings = {
+                f"{hour:02d}:00-{(hour + 1):02d}:00": count
+                for hour, count in hours.items()
+            }
 
             # Sort by booking count and get top hours
             sorted_hours = sorted(
@@ -4,7 +4,15 @@ This module contains base admin classes and mixins used across the app.
 It provides admin interfaces and utility functions for the admin panel.
 """
 
+import re
+from urllib.parse import urljoin
+
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection
+from django.db.models import Q
+from django.utils.encoding import filepath_to_uri
 from django.utils.html import format_html
 
 
@@ -19,6 +27,7 @@ class BaseModelAdmin(admin.ModelAdmin):
     - Common filters for active status and timestamps
     - Pagination set to 25 items per page
     - Makes timestamp fields read-only when editing existing objects
+    - Restricts the changelist query to ``list_only_fields`` when set
 
     Dependencies:
     - Django's ModelAdmin
@@ -30,6 +39,21 @@ class BaseModelAdmin(admin.ModelAdmin):
     ordering = ["-created_at"]
     list_per_page = 25
     readonly_fields = ("created_at", "updated_at")
+    list_only_fields = ()
+
+    def get_queryset(self, request):
+        """
+        Load only ``list_only_fields`` when rendering the changelist.
+
+        Change and delete views keep the full row so forms do not lazily
+        fetch each deferred column.
+        """
+        qs = super().get_queryset(request)
+        match = getattr(request, "resolver_match", None)
+        changelist = f"{self.opts.app_label}_{self.opts.model_name}_changelist"
+        if self.list_only_fields and match and match.url_name == changelist:
+            qs = qs.only(*self.list_only_fields)
+        return qs
 
 
 class AcademyScopedAdmin(BaseModelAdmin):
@@ -65,6 +89,58 @@ class AcademyScopedAdmin(BaseModelAdmin):
         return qs.none()
 
 
+class SearchVectorAdminMixin:
+    """
+    Mixin to answer admin search from a PostgreSQL full-text index.
+
+    Instead of OR-ing an ``icontains`` lookup per entry in ``search_fields``,
+    the search term is matched (as word prefixes) against a single
+    ``SearchVector`` built over ``search_vector_fields``. The model should
+    declare a GIN index on the same expression so the lookup is indexed.
+
+    Features:
+    - Prefix matching for every word of the search term
+    - ``icontains`` matching of the whole term on ``search_contains_fields``,
+      for values the parser keeps as one lexeme (emails, hosts) or that are
+      searched by a fragment (phone numbers)
+    - Falls back to the default admin search on other database backends
+
+    Dependencies:
+    - django.contrib.postgres search expressions
+    """
+
+    search_vector_fields = ()
+    search_vector_config = "simple"
+    search_contains_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Filter the changelist with a full-text query on the search vector.
+        """
+        terms = re.findall(r"\w+", search_term)
+        if (
+            not self.search_vector_fields
+            or not terms
+            or connection.vendor != "postgresql"
+        ):
+            return super().get_search_results(request, queryset, search_term)
+
+        query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            config=self.search_vector_config,
+            search_type="raw",
+        )
+        condition = Q(search=query)
+        for field in self.search_contains_fields:
+            condition |= Q(**{f"{field}__icontains": search_term.strip()})
+        queryset = queryset.annotate(
+            search=SearchVector(
+                *self.search_vector_fields, config=self.search_vector_config
+            )
+        ).filter(condition)
+        return queryset, False
+
+
 class ImagePreviewMixin:
     """
     Mixin to show image preview in admin.
@@ -72,24 +148,44 @@ class ImagePreviewMixin:
     Adds a preview column for image fields in the admin list view.
 
     Features:
-    - Displays thumbnail preview of image fields
-    - Falls back to "No Image" text when no image is available
+    - Displays thumbnail preview of the field named by ``image_field``
+    - Builds the URL from MEDIA_URL and the percent-encoded stored file name,
+      so rendering a changelist makes no storage backend calls
+    - Falls back to ``no_image_text`` when no image is available
+    - Labels the ``image_preview`` list column with ``image_preview_label``
 
     Dependencies:
     - Django's format_html utility
     """
 
+    image_field = "image"
+    no_image_text = "No Image"
+    image_preview_label = "Preview"
+
+    def get_list_display(self, request):
+        """Swap the ``image_preview`` column for one carrying the admin's label."""
+
+        def image_preview(obj):
+            return self.image_preview(obj)
+
+        image_preview.short_description = self.image_preview_label
+        return [
+            image_preview if name == "image_preview" else name
+            for name in super().get_list_display(request)
+        ]
+
     def image_preview(self, obj):
         """
         Generate HTML for image preview.
 
-        Returns a small thumbnail or "No Image" text.
+        Returns a small thumbnail or the ``no_image_text`` marker.
         """
-        if obj.image:
+        image = getattr(obj, self.image_field)
+        if image:
             return format_html(
                 '<img src="{}" style="max-height: 50px; max-width: 50px;"/>',
-                obj.image.url,
+                urljoin(settings.MEDIA_URL, filepath_to_uri(image.name)),
             )
-        return "No Image"
+        return self.no_image_text
 
     image_preview.short_description = "Preview"
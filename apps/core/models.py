@@ -6,8 +6,10 @@ and utility models.
 """
 
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from polymorphic.models import PolymorphicModel
 
 
@@ -130,11 +132,39 @@ class User(AbstractUser):
         """Meta options for User model."""
 
         db_table = "auth_user"
+        # Trigram indexes back the "icontains" user searches used across admins
+        indexes = [
+            GinIndex(
+                fields=["email"], opclasses=["gin_trgm_ops"], name="user_email_trgm"
+            ),
+            GinIndex(
+                fields=["first_name"],
+                opclasses=["gin_trgm_ops"],
+                name="user_first_name_trgm",
+            ),
+            GinIndex(
+                fields=["last_name"],
+                opclasses=["gin_trgm_ops"],
+                name="user_last_name_trgm",
+            ),
+            # Backs the newest-first user listings and date_joined filtering
+            models.Index(fields=["-date_joined"], name="user_date_joined_idx"),
+        ]
 
     def __str__(self):
         """Return string representation of the user."""
         return f"{self.email} - {self.get_user_type_display()}"
 
+    @cached_property
+    def academy_id(self):
+        """
+        Return the id of the academy the user's profile belongs to.
+
+        Reads the foreign key off the profile without loading the academy;
+        None for users without a profile or with a profile outside an academy.
+        """
+        return getattr(getattr(self, "profile", None), "academy_id", None)
+
 
 class UserProfile(PolymorphicModel, BaseModel):
     """
@@ -0,0 +1,48 @@
+"""Core renderers module for the AI Football Platform.
+
+This module contains response renderers shared by the API views.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# OPT_UTC_Z writes UTC datetimes with a "Z" suffix, like DRF's JSON encoder
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson.
+
+    Produces the same document as DRF's JSONRenderer with compact output:
+    datetimes, dates and times are encoded by orjson in the same ISO 8601
+    form as DRF's JSON encoder; values orjson does not handle itself, such
+    as Decimals and lazy strings, go through the DRF JSON encoder.
+
+    Features:
+    - Falls back to JSONRenderer for indented (browsable/pretty) output
+    - Escapes U+2028/U+2029 like JSONRenderer
+
+    Dependencies:
+    - orjson
+    - Django REST Framework's JSONRenderer
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring."""
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.get_indent(accepted_media_type, renderer_context) is not None
+            or not self.compact
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+        )
+        return ret.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
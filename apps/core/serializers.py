@@ -5,12 +5,44 @@ application. It provides consistent API serialization and utility functions for
 REST endpoints.
 """
 
+import copy
+
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 User = get_user_model()
 
 
+class CachedFieldsSerializerMixin:
+    """
+    Serializer mixin that builds the field set once per serializer class.
+
+    ModelSerializer introspects the model to build its fields every time a
+    serializer is instantiated. This mixin keeps the first result per class
+    and gives each instance copies of it: plain fields are shallow-copied,
+    nested serializers are rebuilt because they hold their own bound child.
+
+    Only suitable for serializers whose fields do not depend on the
+    instance or context, e.g. not for a Meta.model assigned at runtime.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        """Return copies of the cached fields for this serializer class."""
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {
+            name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for name, field in self._fields_cache[cls].items()
+        }
+
+
 class BaseModelSerializer(serializers.ModelSerializer):
     """
     Base serializer with common fields for all model serializers.
@@ -33,7 +65,7 @@ class BaseModelSerializer(serializers.ModelSerializer):
         abstract = True
 
 
-class BaseUserSerializer(serializers.ModelSerializer):
+class BaseUserSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Base user serializer for consistent user representation.
 
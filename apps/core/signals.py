@@ -1,7 +1,8 @@
 import logging
 
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db import connections
+from django.db.models.signals import post_save, pre_migrate
 from django.dispatch import receiver
 
 User = get_user_model()
@@ -81,3 +82,22 @@ def update_user_profile(sender, instance, created, **kwargs):
             logger.debug(f"Updated profile for user: {instance.email}")
         except Exception as e:
             logger.error(f"Error updating profile for user {instance.email}: {str(e)}")
+
+
+@receiver(pre_migrate)
+def create_postgres_extensions(sender, using="default", **kwargs):
+    """
+    Make sure the PostgreSQL extensions used by model indexes exist.
+
+    The trigram (gin_trgm_ops) search indexes need pg_trgm to be installed
+    before the migrations that create them run.
+    """
+    if sender.name != "apps.core":
+        return
+
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
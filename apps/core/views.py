@@ -5,6 +5,7 @@ It provides consistent API behavior and utility functions for REST endpoints.
 """
 
 import logging
+from collections import Counter
 
 from django.contrib.auth import get_user_model
 from django.db import models, transaction
@@ -26,7 +27,7 @@ class BaseModelViewSet(viewsets.ModelViewSet):
     Base viewset with common functionality for all model viewsets.
 
     Provides filtering, searching, ordering, and active status handling with
-    atomic transaction support for all database operations.
+    atomic transaction support for all write operations.
 
     Features:
     - Filters out inactive objects by default
@@ -217,8 +218,10 @@ class AcademyScopedViewSet(BaseModelViewSet):
 
         if user.user_type == "system_admin":
             return queryset
-        elif hasattr(user, "profile") and hasattr(user.profile, "academy"):
-            return queryset.filter(academy=user.profile.academy)
+
+        academy_id = user.academy_id
+        if academy_id is not None:
+            return queryset.filter(academy_id=academy_id)
         return queryset.none()
 
 
@@ -337,9 +340,9 @@ class DashboardStatsView(APIView):
     def _get_academy_admin_stats(self, user):
         """Get academy-specific statistics for academy admins."""
         from apps.academies.models import (
+            Academy,
             CoachProfile,
             ExternalClientProfile,
-            ParentProfile,
             PlayerProfile,
         )
         from apps.bookings.models import Field, FieldBooking
@@ -369,10 +372,12 @@ class DashboardStatsView(APIView):
         )
 
         # Get parents count (related through players)
-        parent_ids = set()
-        for player in academy_players:
-            for parent in player.parents.filter(is_active=True):
-                parent_ids.add(parent.id)
+        parents_count = (
+            Academy.objects.filter(pk=academy.pk)
+            .with_parent_count()
+            .values_list("total_parents", flat=True)
+            .get()
+        )
 
         # Get external clients who have booked fields at this academy
         external_client_ids = set()
@@ -386,7 +391,7 @@ class DashboardStatsView(APIView):
             "academy_name": academy.name,
             "coaches_count": academy_coaches.count(),
             "players_count": academy_players.count(),
-            "parents_count": len(parent_ids),
+            "parents_count": parents_count,
             "external_clients_count": len(external_client_ids),
             "fields_count": academy_fields.count(),
             "bookings_count": academy_bookings.count(),
@@ -471,12 +476,9 @@ class DashboardStatsView(APIView):
         ).aggregate(total=models.Sum("total_cost"))["total"] or Decimal("0.00")
 
         # Get favorite academies (academies with most bookings)
-        academy_booking_counts = {}
-        for booking in all_bookings:
-            academy_name = booking.field.academy.name
-            academy_booking_counts[academy_name] = (
-                academy_booking_counts.get(academy_name, 0) + 1
-            )
+        academy_booking_counts = Counter(
+            booking.field.academy.name for booking in all_bookings
+        )
 
         # Sort academies by booking count and get top 3
         favorite_academies = sorted(
@@ -489,7 +491,7 @@ class DashboardStatsView(APIView):
         ]
 
         # Get recent bookings (last 5 bookings)
-        recent_bookings = all_bookings.order_by("-created_at")[:5]
+        recent_bookings = list(all_bookings.order_by("-created_at")[:5])
         recent_bookings_list = []
 
         for booking in recent_bookings:
@@ -507,10 +509,7 @@ class DashboardStatsView(APIView):
             )
 
         # Get booking status distribution
-        status_distribution = {}
-        for booking in all_bookings:
-            status = booking.status
-            status_distribution[status] = status_distribution.get(status, 0) + 1
+        status_distribution = Counter(booking.status for booking in all_bookings)
 
         stats = {
             "user_type": "external_client",
@@ -531,10 +530,8 @@ class DashboardStatsView(APIView):
             "recent_bookings": recent_bookings_list,
             "booking_status_distribution": status_distribution,
             "member_since": user.date_joined.isoformat(),
-            "last_booking_date": all_bookings.order_by("-created_at")
-            .first()
-            .created_at.isoformat()
-            if all_bookings.exists()
+            "last_booking_date": recent_bookings[0].created_at.isoformat()
+            if recent_bookings
             else None,
         }
 
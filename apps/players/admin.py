@@ -95,8 +95,7 @@ class TeamAdmin(AcademyScopedAdmin):
         "coach__user__first_name",
         "coach__user__last_name",
     ]
-    raw_id_fields = ["academy", "coach"]
-    filter_horizontal = ["players"]
+    raw_id_fields = ["academy", "coach", "players"]
 
     fieldsets = (
         (
@@ -76,6 +76,13 @@ class Team(BaseModel):
     age_group = models.CharField(max_length=20)  # U-16, U-18, Senior, etc.
     formation = models.CharField(max_length=20, blank=True)  # 4-4-2, 3-5-2, etc.
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["academy", "is_active"], name="team_academy_active_idx"
+            ),
+        ]
+
     def __str__(self):
         """Return string representation of the team."""
         return f"{self.name} - {self.academy.name}"
@@ -48,10 +48,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop("password_confirm", None)
         password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        return User.objects.create_user(password=password, **validated_data)
 
 
 class PlayerProfileSerializer(BaseModelSerializer):
@@ -472,8 +469,15 @@ class TeamSerializer(BaseModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
     def get_players_count(self, obj):
-        """Get count of active players in this team."""
-        return obj.players.filter(is_active=True).count()
+        """
+        Get count of active players in this team.
+
+        Uses the ``total_active_players`` annotation added by TeamViewSet
+        when present.
+        """
+        if hasattr(obj, "total_active_players"):
+            return obj.total_active_players
+        return obj.total_players
 
     def validate_players(self, value):
         """Validate that all provided players belong to the same academy as the team."""
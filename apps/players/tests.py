@@ -0,0 +1,61 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.academies.models import Academy
+from apps.core.models import User
+from apps.players.models import Team
+
+
+class TeamViewSetTests(TestCase):
+    """Tests for the team API endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="password",
+            user_type="system_admin",
+            first_name="System",
+            last_name="Admin",
+        )
+        cls.academy = Academy.objects.create(
+            name="Academy",
+            name_ar="Academy",
+            address="Address",
+            phone="123",
+            email="academy@example.com",
+        )
+        cls.players = []
+        for number in range(4):
+            user = User.objects.create_user(
+                email=f"player{number}@example.com",
+                password="password",
+                user_type="player",
+                first_name="Player",
+                last_name=str(number),
+            )
+            profile = user.profile
+            profile.academy = cls.academy
+            profile.save()
+            cls.players.append(profile)
+        cls.team = Team.objects.create(
+            name="Team", academy=cls.academy, age_group="U16"
+        )
+        cls.team.players.add(*cls.players[:3])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_partial_update_players_reports_new_players_count(self):
+        url = f"/api/v1/players/team/{self.team.pk}/"
+
+        response = self.client.patch(
+            url,
+            {"players": [player.pk for player in self.players]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["players_count"], 4)
+        self.assertEqual(self.client.get(url).data["players_count"], 4)
@@ -7,6 +7,7 @@ operations with atomic transaction support.
 import logging
 
 from django.db import transaction
+from django.db.models import Count, Q
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
@@ -845,6 +846,20 @@ class TeamViewSet(AcademyScopedViewSet):
             return TeamDetailSerializer
         return TeamSerializer
 
+    def get_queryset(self):
+        """
+        Annotate the active player count shown by the team serializers.
+
+        Only read actions are annotated: writes change the team's players
+        after the object is loaded, so their responses count them afresh.
+        """
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.annotate(
+                total_active_players=Count("players", filter=Q(players__is_active=True))
+            )
+        return queryset
+
     search_fields = [
         "name",
         "age_group",